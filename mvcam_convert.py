@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+MvCam Pixel Format Converters
+JIT-compiled unpacking of 10/12-bit Mono frames, with NumPy fallbacks
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    # Serial on purpose: the unpack is memory-bound, and a parallel kernel on the
+    # camera thread would share Numba's threading layer with the preview filters
+    @njit(cache=True)
+    def _unpack_packed_kernel(src, dst, low_bits, align):
+        """Unpack 2 pixels per 3 bytes (GigE Vision Mono10/12 Packed) to MSB-aligned uint16"""
+        n_pixels = dst.size
+        n_pairs = (n_pixels + 1) // 2
+        mask = (1 << low_bits) - 1
+        for i in range(n_pairs):
+            mid = np.uint16(src[3 * i + 1])
+            p = 2 * i
+            dst[p] = ((np.uint16(src[3 * i]) << low_bits) | (mid & mask)) << align
+            if p + 1 < n_pixels:
+                dst[p + 1] = ((np.uint16(src[3 * i + 2]) << low_bits) | ((mid >> 4) & mask)) << align
+
+def packed_size(n_pixels: int) -> int:
+    """Bytes occupied by n_pixels in a Mono10/12 Packed buffer"""
+    return (n_pixels * 3 + 1) // 2
+
+def _unpack_packed_numpy(src, dst, low_bits, align):
+    """Vectorised fallback for _unpack_packed_kernel"""
+    n_pixels = dst.size
+    n_pairs = n_pixels // 2
+    mask = (1 << low_bits) - 1
+    triples = src[:n_pairs * 3].reshape(n_pairs, 3).astype(np.uint16)
+    mid = triples[:, 1]
+    dst[0:2 * n_pairs:2] = ((triples[:, 0] << low_bits) | (mid & mask)) << align
+    dst[1:2 * n_pairs:2] = ((triples[:, 2] << low_bits) | ((mid >> 4) & mask)) << align
+    if n_pixels % 2:
+        tail = src[n_pairs * 3:n_pairs * 3 + 2].astype(np.uint16)
+        dst[-1] = ((tail[0] << low_bits) | (tail[1] & mask)) << align
+
+def _unpack_packed(src: np.ndarray, out: np.ndarray, bits: int):
+    """Unpack a packed bits-deep Mono buffer into a C-contiguous uint16 array"""
+    if not out.flags.c_contiguous:
+        # reshape() would silently unpack into a copy and leave out untouched
+        raise ValueError(f"Unpack target {out.shape} must be C-contiguous")
+    dst = out.reshape(-1)
+    if src.size < packed_size(dst.size):
+        raise ValueError(f"Packed buffer of {src.size} bytes too small for {dst.size} pixels")
+    if NUMBA_AVAILABLE:
+        _unpack_packed_kernel(src, dst, bits - 8, 16 - bits)
+    else:
+        _unpack_packed_numpy(src, dst, bits - 8, 16 - bits)
+
+def unpack_mono10_packed(src: np.ndarray, out: np.ndarray):
+    """Mono10 Packed bytes -> Mono16 with the 10 significant bits at the top"""
+    _unpack_packed(src, out, 10)
+
+def unpack_mono12_packed(src: np.ndarray, out: np.ndarray):
+    """Mono12 Packed bytes -> Mono16 with the 12 significant bits at the top"""
+    _unpack_packed(src, out, 12)
+
+def widen_mono(src: np.ndarray, out: np.ndarray, bits: int):
+    """Unpacked Mono10/12 (low-aligned uint16) -> Mono16 with the significant bits at the top"""
+    np.left_shift(src, 16 - bits, out=out)
+
+def warm_up():
+    """Compile the JIT kernel up front so the first packed frame is not delayed"""
+    if not NUMBA_AVAILABLE:
+        return
+    sample = np.zeros(6, dtype=np.uint8)
+    unpack_mono12_packed(sample, np.empty(3, dtype=np.uint16))
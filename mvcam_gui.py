@@ -6,13 +6,17 @@ A simple GUI for controlling Hikvision industrial cameras using MvCamCtrlSDK
 
 import sys
 import os
+import time
+import queue
+import threading
+from collections import deque
 import numpy as np
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QGridLayout, QLabel, QPushButton, 
                              QComboBox, QSpinBox, QDoubleSpinBox, QCheckBox,
                              QGroupBox, QTabWidget, QSplitter, QMessageBox,
                              QFileDialog, QProgressBar, QStatusBar, QSlider)
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QSettings
+from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QSettings, QMutex, QWaitCondition, QSize
 from PyQt6.QtGui import QPixmap, QImage, QPalette, QColor, QFont
 import cv2
 
@@ -24,22 +28,198 @@ except ImportError as e:
     print(f"Warning: Could not import MvCamSDK: {e}")
     SDK_AVAILABLE = False
 
+from mvcam_filters import nr_box3, edge_sharpen, warm_up as warm_up_filters
+from mvcam_convert import warm_up as warm_up_converters
+
+# Stylesheets, defined once at import time
+_APP_QSS = """
+    QMainWindow {
+        background-color: #f0f0f0;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #cccccc;
+        border-radius: 6px;
+        margin-top: 6px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    QPushButton {
+        background-color: #4a90e2;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #357abd;
+    }
+    QPushButton:pressed {
+        background-color: #2d5aa0;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+    QComboBox, QSpinBox, QDoubleSpinBox {
+        padding: 4px;
+        border: 1px solid #cccccc;
+        border-radius: 4px;
+        background-color: white;
+    }
+    QTabWidget::pane {
+        border: 1px solid #cccccc;
+        background-color: white;
+    }
+    QTabBar::tab {
+        background-color: #e1e1e1;
+        padding: 8px 16px;
+        margin-right: 2px;
+    }
+    QTabBar::tab:selected {
+        background-color: white;
+    }
+"""
+
+_VIEWER_QSS = """
+    QLabel {
+        background-color: #2b2b2b;
+        border: 2px solid #555555;
+        border-radius: 8px;
+        color: #cccccc;
+    }
+"""
+
 class CameraThread(QThread):
     """Thread for camera operations to avoid blocking the GUI"""
-    image_received = pyqtSignal(np.ndarray)
     status_update = pyqtSignal(str)
     error_occurred = pyqtSignal(str)
     
+    # Blocking wait inside the SDK per grab; frames are emitted as soon as they arrive,
+    # and stop() waits out at most one of these, so keep it short
+    GRAB_TIMEOUT_MS = 150
+    # Back-off when the SDK returns immediately without a frame (error or simulated handle)
+    NO_FRAME_BACKOFF_MS = 100
+    # How often the cumulative dropped-frame count is reported
+    DROP_REPORT_INTERVAL_S = 5.0
+    
     def __init__(self):
         super().__init__()
-        self.running = False
+        # Set by stop(); an Event gives a proper barrier and an interruptible wait
+        self._stop_event = threading.Event()
         self.sdk = None
-        self.current_image = None
+        self.dropped_frames = 0
+        self._wake_mutex = QMutex()
+        self._wake_condition = QWaitCondition()
+        # (buffer index, image) pairs for the FrameProcessor, oldest evicted first;
+        # the consumer returns each pool buffer with release_buffer() once rendered.
+        # The condition also signals the grab loop when a pool buffer comes back.
+        self._frames = deque(maxlen=1)
+        self._frames_condition = threading.Condition()
+        
+        # Placeholder shown while not grabbing, built once and shared read-only
+        self._placeholder = np.zeros((480, 640, 3), dtype=np.uint8)
+        cv2.putText(self._placeholder, "No Camera", (200, 240), 
+                  cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+        self._placeholder.setflags(write=False)
         
     def set_sdk(self, sdk):
         """Set the SDK instance"""
         self.sdk = sdk
         
+    def wake(self):
+        """Wake the thread after the acquisition state has changed"""
+        self._wake_mutex.lock()
+        self._wake_condition.wakeAll()
+        self._wake_mutex.unlock()
+        
+    def _wait_until_grabbing(self):
+        """Park the thread until acquisition starts or the thread is stopped"""
+        self._wake_mutex.lock()
+        try:
+            while not self._stop_event.is_set() and not self.sdk.is_grabbing:
+                self._wake_condition.wait(self._wake_mutex)
+        finally:
+            self._wake_mutex.unlock()
+            
+    def set_buffer_count(self, count):
+        """Let up to count frames be queued or rendering at once (call before start())"""
+        # One frame is with the FrameProcessor and the rest wait in the queue. The
+        # pool gets one spare on top, so the grab loop always has a buffer to fill
+        # and a full queue is relieved by evicting its oldest frame.
+        with self._frames_condition:
+            self._frames = deque(maxlen=max(1, count - 1))
+        self.sdk.set_buffer_count(max(1, count - 1) + 2)
+        
+    def _publish(self, index, image):
+        """Queue a frame for the FrameProcessor, evicting the oldest if the queue is full"""
+        evicted = None
+        with self._frames_condition:
+            if len(self._frames) == self._frames.maxlen:
+                evicted = self._frames.popleft()
+            self._frames.append((index, image))
+            self._frames_condition.notify_all()
+        if evicted is not None:
+            # Displayed frames stay fresh; the stale one goes back to the pool
+            self.release_buffer(evicted[0])
+            self.dropped_frames += 1
+        
+    def next_frame(self, timeout):
+        """Return the oldest queued (buffer index, image), or None after timeout seconds.
+        
+        The caller must pass the index to release_buffer() once done with the image.
+        """
+        with self._frames_condition:
+            if not self._frames_condition.wait_for(lambda: self._frames, timeout):
+                return None
+            return self._frames.popleft()
+        
+    def _wait_for_free_buffer(self):
+        """Block while every pool buffer is queued or being rendered"""
+        with self._frames_condition:
+            while not self._stop_event.is_set() and self.sdk.free_buffers == 0:
+                self._frames_condition.wait(self.NO_FRAME_BACKOFF_MS / 1000)
+        
+    def release_buffer(self, index):
+        """Return a pool buffer to the SDK (index None means the frame is not pooled)"""
+        if index is not None:
+            self.sdk.release(index)
+            with self._frames_condition:
+                self._frames_condition.notify_all()
+        
+    def _to_display_format(self, image):
+        """Convert a frame to 8-bit Mono or BGR with packed pixels, ready for ImageViewer"""
+        if image.ndim == 3 and image.shape[2] == 1:
+            image = image[:, :, 0]
+        if image.dtype != np.uint8:
+            # Mono10/12/16 and other wide formats: keep the most significant byte
+            scale = 255.0 / np.iinfo(image.dtype).max if image.dtype.kind in "ui" else 1.0
+            image = cv2.convertScaleAbs(image, alpha=scale)
+        if image.ndim == 3 and image.shape[2] == 4:
+            # Drop alpha with a strided view; the compaction below copies it in one pass
+            image = image[:, :, :3]
+        # QImage needs packed pixels within each row; the row pitch itself may be padded
+        if image.strides[-1] != 1 or (image.ndim == 3 and image.strides[1] != 3):
+            image = np.ascontiguousarray(image)
+        return image
+        
+    def _drain_to_latest(self, frame):
+        """Replace the frame with the newest one already queued in the SDK, if any"""
+        # Stale SDK frames are discarded without ever taking a pool buffer
+        dropped = self.sdk.refresh_image(frame[0])
+        return frame, dropped
+        
+    def _raise_priority(self):
+        """Raise the grab loop's priority so paint events do not preempt it"""
+        # Not pinned to a CPU: worker threads started from here (cvtColor, OpenMP)
+        # inherit the affinity mask and would all share that one core
+        self.setPriority(QThread.Priority.HighPriority)
+        
     def run(self):
         """Main camera thread loop"""
         try:
@@ -51,93 +231,288 @@ class CameraThread(QThread):
                 self.error_occurred.emit("No SDK instance provided")
                 return
                 
+            self._raise_priority()
             self.status_update.emit("Camera thread started")
+            self.dropped_frames = 0
+            reported_drops = 0
+            last_report = time.monotonic()
             
-            while self.running:
+            while not self._stop_event.is_set():
                 try:
-                    # Get image from camera
-                    if self.sdk and self.sdk.is_grabbing:
-                        image = self.sdk.get_image(timeout_ms=100)
-                        if image is not None:
-                            self.current_image = image
-                            self.image_received.emit(image)
-                        else:
-                            # If no image received, use the last one or create a placeholder
-                            if self.current_image is None:
-                                self.current_image = np.zeros((480, 640, 3), dtype=np.uint8)
-                            self.image_received.emit(self.current_image)
-                    else:
-                        # Create a placeholder image when not grabbing
-                        placeholder = np.zeros((480, 640, 3), dtype=np.uint8)
-                        cv2.putText(placeholder, "No Camera", (200, 240), 
-                                  cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
-                        self.image_received.emit(placeholder)
+                    if not self.sdk.is_grabbing:
+                        # Show the placeholder once, then sleep until acquisition starts
+                        self._publish(None, self._placeholder)
+                        self._wait_until_grabbing()
+                        continue
+                        
+                    # Block in the SDK until a frame is ready in a pool buffer
+                    self._wait_for_free_buffer()
+                    grab_started = time.monotonic()
+                    frame = self.sdk.acquire_image(timeout_ms=self.GRAB_TIMEOUT_MS)
+                    if frame is not None:
+                        # Skip frames that queued up in the SDK while we were busy
+                        (index, pooled), dropped = self._drain_to_latest(frame)
+                        self.dropped_frames += dropped
+                        # Normalise the pixel format here, before the frame is queued
+                        image = self._to_display_format(pooled)
+                        if not np.may_share_memory(image, pooled):
+                            # Converted into a new array, the pool buffer is free already
+                            self.release_buffer(index)
+                            index = None
+                        self._publish(index, image)
+                        
+                        now = time.monotonic()
+                        if now - last_report >= self.DROP_REPORT_INTERVAL_S:
+                            if self.dropped_frames != reported_drops:
+                                self.status_update.emit(f"Dropped {self.dropped_frames} stale frame(s)")
+                                reported_drops = self.dropped_frames
+                            last_report = now
+                    elif time.monotonic() - grab_started < self.GRAB_TIMEOUT_MS / 2000:
+                        # Returned well before the timeout without a frame: back off.
+                        # A normal timeout (routine in trigger mode) grabs again at once.
+                        self._stop_event.wait(self.NO_FRAME_BACKOFF_MS / 1000)
                 
                 except Exception as e:
                     self.error_occurred.emit(f"Image acquisition error: {str(e)}")
                     break
                 
-                self.msleep(50)  # 20 FPS
-                
         except Exception as e:
             self.error_occurred.emit(f"Camera thread error: {str(e)}")
     
+    def start(self, *args):
+        """Start the camera thread"""
+        self._stop_event.clear()
+        super().start(*args)
+    
     def stop(self):
         """Stop the camera thread"""
-        self.running = False
+        self._stop_event.set()
+        self.wake()
+        with self._frames_condition:
+            self._frames_condition.notify_all()
+        self.wait()
+        
+        # Hand back frames never processed before the pool is torn down
+        with self._frames_condition:
+            stale = list(self._frames)
+            self._frames.clear()
+        for index, _ in stale:
+            self.release_buffer(index)
+
+class FrameProcessor(QThread):
+    """Thread that filters, scales and converts frames for display off the GUI thread"""
+    error_occurred = pyqtSignal(str)
+    
+    # How long to wait for a frame before rechecking the stop flag
+    POLL_INTERVAL_S = 0.1
+    # Rendered frames waiting for the GUI; the oldest is dropped when full
+    DISPLAY_QUEUE_SIZE = 2
+    
+    def __init__(self, camera_thread):
+        super().__init__()
+        self._stop_event = threading.Event()
+        self.camera_thread = camera_thread
+        self.display_queue = queue.Queue(maxsize=self.DISPLAY_QUEUE_SIZE)
+        
+        # Options set from the GUI thread and read per frame
+        self.noise_reduction = False
+        self.edge_enhancement = False
+        self.high_quality = False
+        self.target_size = QSize(640, 480)
+        
+        # The fitted display size is recomputed only when the frame or target size changes
+        self._last_source_size = None
+        self._last_target_size = None
+        self._scaled_size = None
+        # Reused cv2.resize output while the display size and format stay the same
+        self._resize_buf = None
+        
+    def set_target_size(self, size):
+        """Set the area frames are fitted into (the image viewer's size)"""
+        self.target_size = QSize(size)
+        
+    def take_latest_image(self):
+        """Return the newest rendered QImage not yet taken, or None"""
+        image = None
+        while True:
+            try:
+                image = self.display_queue.get_nowait()
+            except queue.Empty:
+                return image
+        
+    def _push(self, q_image):
+        """Queue a rendered frame for the GUI, dropping the oldest if it is behind"""
+        try:
+            self.display_queue.put_nowait(q_image)
+        except queue.Full:
+            try:
+                self.display_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.display_queue.put_nowait(q_image)
+        
+    def _render(self, image):
+        """Filter a BGR/Mono frame and convert it to an RGB32 QImage fitted to target_size"""
+        if self.noise_reduction:
+            image = nr_box3(image)
+        if self.edge_enhancement:
+            image = edge_sharpen(image)
+        
+        height, width = image.shape[:2]
+        source_size = QSize(width, height)
+        target_size = self.target_size
+        if source_size != self._last_source_size or target_size != self._last_target_size:
+            self._scaled_size = source_size.scaled(target_size, Qt.AspectRatioMode.KeepAspectRatio)
+            self._last_source_size = source_size
+            self._last_target_size = target_size
+        if self._scaled_size.isEmpty():
+            return None
+        
+        # Scale on the ndarray with OpenCV so Qt never has to rescale the pixmap
+        scaled_width, scaled_height = self._scaled_size.width(), self._scaled_size.height()
+        if (scaled_width, scaled_height) != (width, height):
+            buf_shape = (scaled_height, scaled_width) + image.shape[2:]
+            if self._resize_buf is None or self._resize_buf.shape != buf_shape:
+                self._resize_buf = np.empty(buf_shape, dtype=np.uint8)
+            if not self.high_quality:
+                interpolation = cv2.INTER_NEAREST
+            elif scaled_width < width:
+                interpolation = cv2.INTER_AREA
+            else:
+                interpolation = cv2.INTER_LINEAR
+            image = cv2.resize(image, (scaled_width, scaled_height), dst=self._resize_buf,
+                               interpolation=interpolation)
+            height, width = scaled_height, scaled_width
+        
+        # Expand to BGRA straight into the QImage's own memory - that byte order is
+        # Qt's native RGB32, and the image owns its pixels so it can cross threads
+        q_image = QImage(width, height, QImage.Format.Format_RGB32)
+        bits = q_image.bits()
+        bits.setsize(q_image.sizeInBytes())
+        dst = np.ndarray((height, width, 4), dtype=np.uint8, buffer=bits,
+                         strides=(q_image.bytesPerLine(), 4, 1))
+        code = cv2.COLOR_BGR2BGRA if image.ndim == 3 else cv2.COLOR_GRAY2BGRA
+        cv2.cvtColor(image, code, dst=dst)
+        return q_image
+        
+    def run(self):
+        """Main frame processing loop"""
+        # Compile the image filters and pixel unpackers here, off the GUI thread,
+        # and one after the other so no two JIT warm-ups run at once
+        warm_up_filters()
+        warm_up_converters()
+        
+        while not self._stop_event.is_set():
+            frame = self.camera_thread.next_frame(self.POLL_INTERVAL_S)
+            if frame is None:
+                continue
+            
+            index, image = frame
+            try:
+                q_image = self._render(image)
+            except Exception as e:
+                self.error_occurred.emit(f"Image processing error: {str(e)}")
+                break
+            finally:
+                self.camera_thread.release_buffer(index)
+            if q_image is not None:
+                self._push(q_image)
+    
+    def start(self, *args):
+        """Start the processing thread"""
+        self._stop_event.clear()
+        super().start(*args)
+    
+    def stop(self):
+        """Stop the processing thread"""
+        self._stop_event.set()
         self.wait()
 
 class ImageViewer(QLabel):
     """Custom widget for displaying camera images"""
+    # Emitted with the new widget size so frames can be rendered to fit
+    size_changed = pyqtSignal(QSize)
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMinimumSize(640, 480)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setStyleSheet("""
-            QLabel {
-                background-color: #2b2b2b;
-                border: 2px solid #555555;
-                border-radius: 8px;
-                color: #cccccc;
-            }
-        """)
+        self.setStyleSheet(_VIEWER_QSS)
         self.setText("No Image")
-        
-    def set_image(self, image):
-        """Display an OpenCV image"""
-        if image is None:
+        # Frame currently shown, kept so resizes can refit it until the next one
+        self._image = None
+
+    def set_image(self, q_image):
+        """Display a QImage already rendered to fit the widget"""
+        if q_image is None:
             self.setText("No Image")
             return
             
-        # Convert OpenCV BGR to RGB
-        if len(image.shape) == 3:
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        else:
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
-            
-        # Convert to QImage
-        height, width, channel = image_rgb.shape
-        bytes_per_line = 3 * width
-        q_image = QImage(image_rgb.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
-        
-        # Scale to fit the widget while maintaining aspect ratio
-        pixmap = QPixmap.fromImage(q_image)
-        scaled_pixmap = pixmap.scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatio, 
-                                     Qt.TransformationMode.SmoothTransformation)
-        self.setPixmap(scaled_pixmap)
+        self._image = q_image
+        self._update_scaled_pixmap()
+        
+    def _update_scaled_pixmap(self):
+        """Show the current frame, rescaling it only if the widget size has changed"""
+        if self._image is None:
+            return
+            
+        pixmap = QPixmap.fromImage(self._image)
+        # Frames arrive at the fitted size; only a resize since rendering needs Qt
+        # to scale, and the next frame corrects it
+        scaled_size = pixmap.size().scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatio)
+        if not scaled_size.isEmpty() and pixmap.size() != scaled_size:
+            pixmap = pixmap.scaled(scaled_size, Qt.AspectRatioMode.IgnoreAspectRatio,
+                                   Qt.TransformationMode.FastTransformation)
+        self.setPixmap(pixmap)
+        
+    def resizeEvent(self, event):
+        """Refit the current frame when the widget is resized"""
+        super().resizeEvent(event)
+        self.size_changed.emit(event.size())
+        self._update_scaled_pixmap()
 
 class MvCamGUI(QMainWindow):
     """Main GUI window for MvCam camera control"""
     
+    # Display refresh period (~30 Hz)
+    DISPLAY_INTERVAL_MS = 33
+    # Quiet period before setting changes are sent to the camera
+    SETTINGS_DEBOUNCE_MS = 150
+    # Frame buffers for free-running acquisition, and for low-latency trigger mode
+    DEFAULT_BUFFER_COUNT = 3
+    TRIGGER_BUFFER_COUNT = 1
+    # Setting names used in error messages
+    _SETTING_LABELS = {
+        'exposure': "Exposure",
+        'gain': "Gain",
+        'framerate': "Frame rate",
+        'trigger': "Trigger mode",
+    }
+    
     def __init__(self):
         super().__init__()
         self.camera_thread = None
         self.sdk = None
         self.settings = QSettings("MvCamGUI", "CameraControl")
+        
+        # Setting changes are collected here and applied once the user pauses;
+        # _last_sent holds what the camera already has so unchanged values are skipped
+        self._pending = {}
+        self._last_sent = {}
+        self._apply_timer = QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.setInterval(self.SETTINGS_DEBOUNCE_MS)
+        self._apply_timer.timeout.connect(self._apply_pending)
+        
         self.init_ui()
         self.load_settings()
         
+        # Repaint at a bounded rate regardless of the camera frame rate
+        self.display_timer = QTimer(self)
+        self.display_timer.setInterval(self.DISPLAY_INTERVAL_MS)
+        self.display_timer.timeout.connect(self.update_display)
+        self.display_timer.start()
+        
         # Initialize SDK if available
         if SDK_AVAILABLE:
             try:
@@ -162,59 +537,7 @@ class MvCamGUI(QMainWindow):
         self.setGeometry(100, 100, 1200, 800)
         
         # Set application style
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f0f0f0;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 6px;
-                margin-top: 6px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QPushButton {
-                background-color: #4a90e2;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #357abd;
-            }
-            QPushButton:pressed {
-                background-color: #2d5aa0;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-            QComboBox, QSpinBox, QDoubleSpinBox {
-                padding: 4px;
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                background-color: white;
-            }
-            QTabWidget::pane {
-                border: 1px solid #cccccc;
-                background-color: white;
-            }
-            QTabBar::tab {
-                background-color: #e1e1e1;
-                padding: 8px 16px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: white;
-            }
-        """)
+        self.setStyleSheet(_APP_QSS)
         
         # Create central widget
         central_widget = QWidget()
@@ -244,10 +567,16 @@ class MvCamGUI(QMainWindow):
         
         # Setup camera thread
         self.camera_thread = CameraThread()
-        self.camera_thread.image_received.connect(self.on_image_received)
         self.camera_thread.status_update.connect(self.on_status_update)
         self.camera_thread.error_occurred.connect(self.on_error_occurred)
         
+        # Setup frame processing thread, fed by the camera thread
+        self.frame_processor = FrameProcessor(self.camera_thread)
+        self.frame_processor.error_occurred.connect(self.on_error_occurred)
+        self.frame_processor.set_target_size(self.image_viewer.size())
+        self.image_viewer.size_changed.connect(self.frame_processor.set_target_size)
+        self.frame_processor.start()
+        
     def create_camera_panel(self, parent):
         """Create the camera view panel"""
         camera_widget = QWidget()
@@ -304,20 +633,31 @@ class MvCamGUI(QMainWindow):
         layout = QVBoxLayout(control_widget)
         
         # Create tab widget for different control sections
-        tab_widget = QTabWidget()
-        layout.addWidget(tab_widget)
+        self.tab_widget = QTabWidget()
+        layout.addWidget(self.tab_widget)
         
         # Camera settings tab
-        self.create_camera_settings_tab(tab_widget)
-        
-        # Image settings tab
-        self.create_image_settings_tab(tab_widget)
-        
-        # Trigger settings tab
-        self.create_trigger_settings_tab(tab_widget)
+        self.create_camera_settings_tab(self.tab_widget)
+        
+        # Image and trigger tabs start empty and are built the first time they are shown
+        self.noise_reduction_check = None
+        self.edge_enhancement_check = None
+        self.trigger_mode_combo = None
+        self.trigger_button = None
+        self._lazy_tabs = {
+            self.tab_widget.addTab(QWidget(), "Image Settings"): self.create_image_settings_tab,
+            self.tab_widget.addTab(QWidget(), "Trigger & Save"): self.create_trigger_settings_tab,
+        }
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
         
         parent.addWidget(control_widget)
         
+    def on_tab_changed(self, index):
+        """Build a lazily created tab the first time it is shown"""
+        create_tab = self._lazy_tabs.pop(index, None)
+        if create_tab:
+            create_tab(self.tab_widget.widget(index))
+        
     def create_camera_settings_tab(self, parent):
         """Create camera settings tab"""
         settings_widget = QWidget()
@@ -373,14 +713,20 @@ class MvCamGUI(QMainWindow):
         self.framerate_spinbox.valueChanged.connect(self.on_framerate_changed)
         framerate_layout.addWidget(self.framerate_spinbox, 0, 1)
         
+        framerate_layout.addWidget(QLabel("Frame Buffers:"), 1, 0)
+        self.buffer_count_spinbox = QSpinBox()
+        self.buffer_count_spinbox.setRange(1, 16)
+        self.buffer_count_spinbox.setValue(self.DEFAULT_BUFFER_COUNT)
+        self.buffer_count_spinbox.setToolTip("Fewer buffers lower latency, more absorb display stalls")
+        framerate_layout.addWidget(self.buffer_count_spinbox, 1, 1)
+        
         layout.addWidget(framerate_group)
         
         layout.addStretch()
         parent.addTab(settings_widget, "Camera Settings")
         
-    def create_image_settings_tab(self, parent):
+    def create_image_settings_tab(self, image_widget):
         """Create image settings tab"""
-        image_widget = QWidget()
         layout = QVBoxLayout(image_widget)
         
         # Image format settings
@@ -415,19 +761,24 @@ class MvCamGUI(QMainWindow):
         processing_layout.addWidget(self.auto_white_balance_check)
         
         self.noise_reduction_check = QCheckBox("Noise Reduction")
+        self.noise_reduction_check.toggled.connect(self.on_processing_changed)
         processing_layout.addWidget(self.noise_reduction_check)
         
         self.edge_enhancement_check = QCheckBox("Edge Enhancement")
+        self.edge_enhancement_check.toggled.connect(self.on_processing_changed)
         processing_layout.addWidget(self.edge_enhancement_check)
         
+        self.high_quality_preview_check = QCheckBox("High Quality Preview")
+        self.high_quality_preview_check.setToolTip("Filtered preview scaling (uses more CPU)")
+        self.high_quality_preview_check.toggled.connect(self.on_processing_changed)
+        processing_layout.addWidget(self.high_quality_preview_check)
+        
         layout.addWidget(processing_group)
         
         layout.addStretch()
-        parent.addTab(image_widget, "Image Settings")
         
-    def create_trigger_settings_tab(self, parent):
+    def create_trigger_settings_tab(self, trigger_widget):
         """Create trigger settings tab"""
-        trigger_widget = QWidget()
         layout = QVBoxLayout(trigger_widget)
         
         # Trigger mode settings
@@ -442,7 +793,8 @@ class MvCamGUI(QMainWindow):
         
         self.trigger_button = QPushButton("Software Trigger")
         self.trigger_button.clicked.connect(self.software_trigger)
-        self.trigger_button.setEnabled(False)
+        # The tab may be built after acquisition has already started
+        self.trigger_button.setEnabled(bool(self.sdk and self.sdk.is_grabbing))
         trigger_layout.addWidget(self.trigger_button, 1, 0, 1, 2)
         
         layout.addWidget(trigger_group)
@@ -462,7 +814,6 @@ class MvCamGUI(QMainWindow):
         layout.addWidget(save_group)
         
         layout.addStretch()
-        parent.addTab(trigger_widget, "Trigger & Save")
         
     def create_status_bar(self):
         """Create the status bar"""
@@ -584,6 +935,7 @@ class MvCamGUI(QMainWindow):
             # Disconnect from camera
             if self.sdk:
                 self.sdk.disconnect()
+            self._last_sent.clear()
             
             self.camera_info_label.setText("Camera: Not Connected")
             self.camera_info_label.setStyleSheet("font-weight: bold; color: #e74c3c;")
@@ -605,16 +957,19 @@ class MvCamGUI(QMainWindow):
                 QMessageBox.warning(self, "Warning", "Please connect to a camera first")
                 return
                 
-            # Start grabbing
+            # Size the frame pool and queue, then start grabbing
+            self.camera_thread.set_buffer_count(self.buffer_count_spinbox.value())
             self.sdk.start_grabbing()
             
-            # Start camera thread
-            self.camera_thread.running = True
+            # Start camera thread, or wake it if it is parked waiting for frames
             self.camera_thread.start()
+            self.camera_thread.wake()
             
             self.start_button.setEnabled(False)
             self.stop_button.setEnabled(True)
-            self.trigger_button.setEnabled(True)
+            self.buffer_count_spinbox.setEnabled(False)
+            if self.trigger_button is not None:
+                self.trigger_button.setEnabled(True)
             
             self.status_label.setText("Acquisition started")
             
@@ -633,7 +988,9 @@ class MvCamGUI(QMainWindow):
             
             self.start_button.setEnabled(True)
             self.stop_button.setEnabled(False)
-            self.trigger_button.setEnabled(False)
+            self.buffer_count_spinbox.setEnabled(True)
+            if self.trigger_button is not None:
+                self.trigger_button.setEnabled(False)
             
             self.status_label.setText("Acquisition stopped")
             
@@ -645,39 +1002,19 @@ class MvCamGUI(QMainWindow):
         if not self.sdk or not self.sdk.is_connected:
             return
         
-        try:
-            # Apply exposure settings
-            if self.auto_exposure_check.isChecked():
-                self.sdk.set_auto_exposure(True)
-            else:
-                self.sdk.set_auto_exposure(False)
-                self.sdk.set_exposure_time(self.exposure_spinbox.value())
-            
-            # Apply gain settings
-            if self.auto_gain_check.isChecked():
-                self.sdk.set_auto_gain(True)
-            else:
-                self.sdk.set_auto_gain(False)
-                self.sdk.set_gain(self.gain_spinbox.value())
-            
-            # Apply frame rate
-            self.sdk.set_frame_rate(self.framerate_spinbox.value())
-            
-            # Apply trigger settings
-            trigger_mode = self.trigger_mode_combo.currentText()
-            if trigger_mode == "Off":
-                self.sdk.set_trigger_mode(TriggerMode.Off)
-            elif trigger_mode == "Software":
-                self.sdk.set_trigger_mode(TriggerMode.On)
-                self.sdk.set_trigger_source(TriggerSource.Software)
-            elif trigger_mode == "Hardware":
-                self.sdk.set_trigger_mode(TriggerMode.On)
-                self.sdk.set_trigger_source(TriggerSource.Line1)
-            
+        # Send everything, not just what changed since the last commit
+        self._last_sent.clear()
+        self._pending.update(exposure=self._exposure_setting(),
+                             gain=self._gain_setting(),
+                             framerate=self.framerate_spinbox.value(),
+                             trigger=self._trigger_setting())
+        self._apply_timer.stop()
+        errors = self._apply_pending()
+        
+        if errors:
+            QMessageBox.warning(self, "Settings Error", f"Failed to apply some settings: {'; '.join(errors)}")
+        else:
             self.status_label.setText("Camera settings applied")
-            
-        except Exception as e:
-            QMessageBox.warning(self, "Settings Error", f"Failed to apply some settings: {str(e)}")
     
     def software_trigger(self):
         """Send software trigger"""
@@ -686,6 +1023,11 @@ class MvCamGUI(QMainWindow):
                 QMessageBox.warning(self, "Warning", "Camera not connected")
                 return
             
+            # Commit a trigger mode change still waiting on the debounce first
+            if self._apply_timer.isActive():
+                self._apply_timer.stop()
+                self._apply_pending()
+            
             if self.sdk.send_software_trigger():
                 self.status_label.setText("Software trigger sent")
             else:
@@ -726,9 +1068,17 @@ class MvCamGUI(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Video Error", f"Failed to toggle video recording: {str(e)}")
             
-    def on_image_received(self, image):
-        """Handle received image from camera thread"""
-        self.image_viewer.set_image(image)
+    def update_display(self):
+        """Show the newest frame from the frame processor, if one has arrived"""
+        q_image = self.frame_processor.take_latest_image()
+        if q_image is not None:
+            self.image_viewer.set_image(q_image)
+            
+    def on_processing_changed(self):
+        """Pass the image processing options to the frame processor"""
+        self.frame_processor.noise_reduction = self.noise_reduction_check.isChecked()
+        self.frame_processor.edge_enhancement = self.edge_enhancement_check.isChecked()
+        self.frame_processor.high_quality = self.high_quality_preview_check.isChecked()
         
     def on_status_update(self, status):
         """Handle status updates from camera thread"""
@@ -739,53 +1089,101 @@ class MvCamGUI(QMainWindow):
         QMessageBox.critical(self, "Camera Error", error)
         self.status_label.setText("Error occurred")
     
+    def _exposure_setting(self):
+        """Exposure as sent to the camera: (auto, exposure_us), with no value in auto mode"""
+        if self.auto_exposure_check.isChecked():
+            return (True, None)
+        return (False, self.exposure_spinbox.value())
+    
+    def _gain_setting(self):
+        """Gain as sent to the camera: (auto, gain_db), with no value in auto mode"""
+        if self.auto_gain_check.isChecked():
+            return (True, None)
+        return (False, self.gain_spinbox.value())
+    
+    def _trigger_setting(self):
+        """Trigger mode name (default "Off" until the trigger tab is built)"""
+        if self.trigger_mode_combo is None:
+            return "Off"
+        return self.trigger_mode_combo.currentText()
+    
+    def _queue_setting(self, key, value):
+        """Mark a setting dirty and (re)arm the commit timer"""
+        if self.sdk and self.sdk.is_connected:
+            self._pending[key] = value
+            self._apply_timer.start()
+    
     def on_exposure_changed(self):
         """Handle exposure setting changes"""
-        if self.sdk and self.sdk.is_connected:
-            try:
-                if self.auto_exposure_check.isChecked():
-                    self.sdk.set_auto_exposure(True)
-                else:
-                    self.sdk.set_auto_exposure(False)
-                    self.sdk.set_exposure_time(self.exposure_spinbox.value())
-            except Exception as e:
-                print(f"Exposure change error: {e}")
+        self._queue_setting('exposure', self._exposure_setting())
     
     def on_gain_changed(self):
         """Handle gain setting changes"""
-        if self.sdk and self.sdk.is_connected:
-            try:
-                if self.auto_gain_check.isChecked():
-                    self.sdk.set_auto_gain(True)
-                else:
-                    self.sdk.set_auto_gain(False)
-                    self.sdk.set_gain(self.gain_spinbox.value())
-            except Exception as e:
-                print(f"Gain change error: {e}")
+        self._queue_setting('gain', self._gain_setting())
     
     def on_framerate_changed(self):
         """Handle frame rate setting changes"""
-        if self.sdk and self.sdk.is_connected:
-            try:
-                self.sdk.set_frame_rate(self.framerate_spinbox.value())
-            except Exception as e:
-                print(f"Frame rate change error: {e}")
+        self._queue_setting('framerate', self.framerate_spinbox.value())
     
     def on_trigger_mode_changed(self):
         """Handle trigger mode changes"""
-        if self.sdk and self.sdk.is_connected:
+        trigger = self._trigger_setting()
+        # Triggered frames should be shown as soon as they arrive, not queued behind others
+        if self.buffer_count_spinbox.isEnabled():
+            self.buffer_count_spinbox.setValue(self.DEFAULT_BUFFER_COUNT if trigger == "Off"
+                                               else self.TRIGGER_BUFFER_COUNT)
+        self._queue_setting('trigger', trigger)
+    
+    def _send_setting(self, key, value):
+        """Issue the SDK calls for one setting, returning True if the camera accepted them"""
+        if key == 'exposure':
+            auto, exposure_us = value
+            if auto:
+                return self.sdk.set_auto_exposure(True)
+            ok = self.sdk.set_auto_exposure(False)
+            return self.sdk.set_exposure_time(exposure_us) and ok
+        
+        if key == 'gain':
+            auto, gain_db = value
+            if auto:
+                return self.sdk.set_auto_gain(True)
+            ok = self.sdk.set_auto_gain(False)
+            return self.sdk.set_gain(gain_db) and ok
+        
+        if key == 'framerate':
+            return self.sdk.set_frame_rate(value)
+        
+        if key == 'trigger':
+            # Mode and source go out together so a Software/Hardware switch is one burst
+            if value == "Off":
+                return self.sdk.set_trigger_mode(TriggerMode.Off)
+            source = TriggerSource.Software if value == "Software" else TriggerSource.Line1
+            ok = self.sdk.set_trigger_mode(TriggerMode.On)
+            return self.sdk.set_trigger_source(source) and ok
+        
+        raise ValueError(f"Unknown setting: {key}")
+    
+    def _apply_pending(self):
+        """Send all dirty settings to the camera in one pass, skipping values already sent.
+        
+        Returns a list of error messages for settings that could not be applied.
+        """
+        pending, self._pending = self._pending, {}
+        errors = []
+        if not self.sdk or not self.sdk.is_connected:
+            return errors
+        
+        for key, value in pending.items():
+            if key in self._last_sent and self._last_sent[key] == value:
+                continue
             try:
-                trigger_mode = self.trigger_mode_combo.currentText()
-                if trigger_mode == "Off":
-                    self.sdk.set_trigger_mode(TriggerMode.Off)
-                elif trigger_mode == "Software":
-                    self.sdk.set_trigger_mode(TriggerMode.On)
-                    self.sdk.set_trigger_source(TriggerSource.Software)
-                elif trigger_mode == "Hardware":
-                    self.sdk.set_trigger_mode(TriggerMode.On)
-                    self.sdk.set_trigger_source(TriggerSource.Line1)
+                if self._send_setting(key, value):
+                    self._last_sent[key] = value
             except Exception as e:
-                print(f"Trigger mode change error: {e}")
+                label = self._SETTING_LABELS[key]
+                print(f"{label} change error: {e}")
+                errors.append(f"{label}: {e}")
+        return errors
         
     def show_about(self):
         """Show about dialog"""
@@ -801,11 +1199,18 @@ class MvCamGUI(QMainWindow):
         geometry = self.settings.value("geometry")
         if geometry:
             self.restoreGeometry(geometry)
+        # Stored geometry, so save_settings can skip an unchanged write
+        self._saved_geometry = geometry
             
     def save_settings(self):
         """Save application settings"""
-        # Save window geometry
-        self.settings.setValue("geometry", self.saveGeometry())
+        # Save window geometry only if it changed, then flush once
+        geometry = self.saveGeometry()
+        if geometry == self._saved_geometry:
+            return
+        self.settings.setValue("geometry", geometry)
+        self.settings.sync()
+        self._saved_geometry = geometry
         
     def closeEvent(self, event):
         """Handle application close event"""
@@ -814,6 +1219,9 @@ class MvCamGUI(QMainWindow):
         if self.camera_thread and self.camera_thread.isRunning():
             self.camera_thread.stop()
         
+        if self.frame_processor.isRunning():
+            self.frame_processor.stop()
+        
         if self.sdk:
             self.sdk.disconnect()
             
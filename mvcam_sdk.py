@@ -6,10 +6,17 @@ Python wrapper for Hikvision MvCamCtrlSDK
 
 import os
 import ctypes
+import queue
+import threading
+from collections import deque
 import numpy as np
+import cv2
 from typing import Optional, List, Tuple, Dict, Any
 from enum import IntEnum
 
+from mvcam_convert import (unpack_mono10_packed, unpack_mono12_packed, widen_mono,
+                           packed_size)
+
 # SDK Library path
 SDK_LIB_PATH = "/opt/MVS/lib/64/libMvCameraControl.so"
 
@@ -30,16 +37,44 @@ class MvCamError(IntEnum):
     # Additional error codes found in practice
     MV_E_NO_CAMERAS = -2147483644  # No cameras available
 
+# Plain int for the per-call success checks, avoiding IntEnum comparison overhead
+_MV_OK = int(MvCamError.MV_OK)
+
 class PixelFormat(IntEnum):
-    """Pixel format definitions"""
+    """Pixel format definitions (GigE Vision / GenICam PFNC values used by the SDK)"""
     Mono8 = 0x01080001
-    Mono10 = 0x01100007
-    Mono12 = 0x01100008
+    Mono10 = 0x01100003
+    Mono10_Packed = 0x010C0004
+    Mono12 = 0x01100005
+    Mono12_Packed = 0x010C0006
     Mono16 = 0x01100007
+    BayerGR8 = 0x01080008
+    BayerRG8 = 0x01080009
+    BayerGB8 = 0x0108000A
+    BayerBG8 = 0x0108000B
     RGB8_Packed = 0x02180014
-    BGR8_Packed = 0x02180020
-    YUV422_Packed = 0x02100032
-    YUV422_YUYV_Packed = 0x0210001F
+    BGR8_Packed = 0x02180015
+    YUV422_Packed = 0x0210001F
+    YUV422_YUYV_Packed = 0x02100032
+
+# Deeper Mono formats, delivered as Mono16 with the significant bits at the top
+_MONO_WIDE_BITS = {
+    PixelFormat.Mono10: 10,
+    PixelFormat.Mono12: 12,
+}
+_MONO_UNPACKERS = {
+    PixelFormat.Mono10_Packed: unpack_mono10_packed,
+    PixelFormat.Mono12_Packed: unpack_mono12_packed,
+}
+# Colour formats demosaiced/converted to BGR by OpenCV: (source channels, cvtColor code)
+_BGR_CONVERSIONS = {
+    PixelFormat.BayerGR8: (1, cv2.COLOR_BayerGRBG2BGR),
+    PixelFormat.BayerRG8: (1, cv2.COLOR_BayerRGGB2BGR),
+    PixelFormat.BayerGB8: (1, cv2.COLOR_BayerGBRG2BGR),
+    PixelFormat.BayerBG8: (1, cv2.COLOR_BayerBGGR2BGR),
+    PixelFormat.YUV422_Packed: (2, cv2.COLOR_YUV2BGR_UYVY),
+    PixelFormat.YUV422_YUYV_Packed: (2, cv2.COLOR_YUV2BGR_YUYV),
+}
 
 class TriggerMode(IntEnum):
     """Trigger mode definitions"""
@@ -53,6 +88,240 @@ class TriggerSource(IntEnum):
     Line2 = 2
     Line3 = 3
 
+class _MV_FRAME_OUT_INFO_EX_UNPARSED_CHUNK(ctypes.Union):
+    """Chunk list pointer, padded to 8 bytes on all platforms"""
+    _fields_ = [
+        ('pUnparsedChunkContent', ctypes.c_void_p),
+        ('nAligning', ctypes.c_int64),
+    ]
+
+class MV_FRAME_OUT_INFO_EX(ctypes.Structure):
+    """Frame description filled in by MV_CC_GetImageBuffer"""
+    _fields_ = [
+        ('nWidth', ctypes.c_ushort),
+        ('nHeight', ctypes.c_ushort),
+        ('enPixelType', ctypes.c_int),
+        ('nFrameNum', ctypes.c_uint),
+        ('nDevTimeStampHigh', ctypes.c_uint),
+        ('nDevTimeStampLow', ctypes.c_uint),
+        ('nReserved0', ctypes.c_uint),
+        ('nHostTimeStamp', ctypes.c_int64),
+        ('nFrameLen', ctypes.c_uint),
+        ('nSecondCount', ctypes.c_uint),
+        ('nCycleCount', ctypes.c_uint),
+        ('nCycleOffset', ctypes.c_uint),
+        ('fGain', ctypes.c_float),
+        ('fExposureTime', ctypes.c_float),
+        ('nAverageBrightness', ctypes.c_uint),
+        ('nRed', ctypes.c_uint),
+        ('nGreen', ctypes.c_uint),
+        ('nBlue', ctypes.c_uint),
+        ('nFrameCounter', ctypes.c_uint),
+        ('nTriggerIndex', ctypes.c_uint),
+        ('nInput', ctypes.c_uint),
+        ('nOutput', ctypes.c_uint),
+        ('nOffsetX', ctypes.c_ushort),
+        ('nOffsetY', ctypes.c_ushort),
+        ('nChunkWidth', ctypes.c_ushort),
+        ('nChunkHeight', ctypes.c_ushort),
+        ('nLostPacket', ctypes.c_uint),
+        ('nUnparsedChunkNum', ctypes.c_uint),
+        ('UnparsedChunkList', _MV_FRAME_OUT_INFO_EX_UNPARSED_CHUNK),
+        ('nExtendWidth', ctypes.c_uint),
+        ('nExtendHeight', ctypes.c_uint),
+        # Reserved tail; sized generously so newer SDKs never write past the struct
+        ('nReserved', ctypes.c_uint * 36),
+    ]
+
+class MV_FRAME_OUT(ctypes.Structure):
+    """SDK-owned image buffer plus its description"""
+    _fields_ = [
+        ('pBufAddr', ctypes.POINTER(ctypes.c_ubyte)),
+        ('stFrameInfo', MV_FRAME_OUT_INFO_EX),
+        ('nRes', ctypes.c_uint * 16),
+    ]
+
+# Transport layer flags for MV_CC_EnumDevices / MV_CC_DEVICE_INFO.nTLayerType
+MV_GIGE_DEVICE = 0x00000001
+MV_USB_DEVICE = 0x00000004
+MV_MAX_DEVICE_NUM = 256
+
+class MV_GIGE_DEVICE_INFO(ctypes.Structure):
+    """GigE Vision camera description"""
+    _fields_ = [
+        ('nIpCfgOption', ctypes.c_uint),
+        ('nIpCfgCurrent', ctypes.c_uint),
+        ('nCurrentIp', ctypes.c_uint),
+        ('nCurrentSubNetMask', ctypes.c_uint),
+        ('nDefultGateWay', ctypes.c_uint),
+        ('chManufacturerName', ctypes.c_ubyte * 32),
+        ('chModelName', ctypes.c_ubyte * 32),
+        ('chDeviceVersion', ctypes.c_ubyte * 32),
+        ('chManufacturerSpecificInfo', ctypes.c_ubyte * 48),
+        ('chSerialNumber', ctypes.c_ubyte * 16),
+        ('chUserDefinedName', ctypes.c_ubyte * 16),
+        ('nNetExport', ctypes.c_uint),
+        ('nReserved', ctypes.c_uint * 4),
+    ]
+
+class MV_USB3_DEVICE_INFO(ctypes.Structure):
+    """USB3 Vision camera description"""
+    _fields_ = [
+        ('CrtlInEndPoint', ctypes.c_ubyte),
+        ('CrtlOutEndPoint', ctypes.c_ubyte),
+        ('StreamEndPoint', ctypes.c_ubyte),
+        ('EventEndPoint', ctypes.c_ubyte),
+        ('idVendor', ctypes.c_ushort),
+        ('idProduct', ctypes.c_ushort),
+        ('nDeviceNumber', ctypes.c_uint),
+        ('chDeviceGUID', ctypes.c_ubyte * 64),
+        ('chVendorName', ctypes.c_ubyte * 64),
+        ('chModelName', ctypes.c_ubyte * 64),
+        ('chFamilyName', ctypes.c_ubyte * 64),
+        ('chDeviceVersion', ctypes.c_ubyte * 64),
+        ('chManufacturerName', ctypes.c_ubyte * 64),
+        ('chSerialNumber', ctypes.c_ubyte * 64),
+        ('chUserDefinedName', ctypes.c_ubyte * 64),
+        ('nbcdUSB', ctypes.c_uint),
+        ('nDeviceAddress', ctypes.c_uint),
+        ('nReserved', ctypes.c_uint * 2),
+    ]
+
+class _MV_CC_DEVICE_INFO_SPECIAL(ctypes.Union):
+    """Transport-specific part of MV_CC_DEVICE_INFO, selected by nTLayerType"""
+    _fields_ = [
+        ('stGigEInfo', MV_GIGE_DEVICE_INFO),
+        ('stUsb3VInfo', MV_USB3_DEVICE_INFO),
+    ]
+
+class MV_CC_DEVICE_INFO(ctypes.Structure):
+    """One enumerated camera (records are owned by the SDK and read through pointers)"""
+    _fields_ = [
+        ('nMajorVer', ctypes.c_ushort),
+        ('nMinorVer', ctypes.c_ushort),
+        ('nMacAddrHigh', ctypes.c_uint),
+        ('nMacAddrLow', ctypes.c_uint),
+        ('nTLayerType', ctypes.c_uint),
+        ('nReserved', ctypes.c_uint * 4),
+        ('SpecialInfo', _MV_CC_DEVICE_INFO_SPECIAL),
+    ]
+
+class MV_CC_DEVICE_INFO_LIST(ctypes.Structure):
+    """Output of MV_CC_EnumDevices"""
+    _fields_ = [
+        ('nDeviceNum', ctypes.c_uint),
+        ('pDeviceInfo', ctypes.POINTER(MV_CC_DEVICE_INFO) * MV_MAX_DEVICE_NUM),
+    ]
+
+class MVCC_FLOATVALUE(ctypes.Structure):
+    """Float feature value with its range, filled in by MV_CC_GetFloatValue"""
+    _fields_ = [
+        ('fCurValue', ctypes.c_float),
+        ('fMax', ctypes.c_float),
+        ('fMin', ctypes.c_float),
+        ('nReserved', ctypes.c_uint * 4),
+    ]
+
+# GenICam feature names passed to the Set/Get*Value calls
+_K_EXPOSURE = b"ExposureTime"
+_K_GAIN = b"Gain"
+_K_FPS = b"AcquisitionFrameRate"
+_K_EXPOSURE_AUTO = b"ExposureAuto"
+_K_GAIN_AUTO = b"GainAuto"
+_K_TRIGGER_MODE = b"TriggerMode"
+_K_TRIGGER_SOURCE = b"TriggerSource"
+_K_TRIGGER_SOFTWARE = b"TriggerSoftware"
+
+def _c_string(chars) -> str:
+    """Decode a NUL-terminated fixed-size char array from an SDK struct"""
+    return bytes(chars).split(b'\x00', 1)[0].decode('ascii', errors='replace')
+
+def _configure_prototypes(lib):
+    """Define SDK function signatures (once per process, shared by all MvCamSDK instances)"""
+    # With argtypes declared, ctypes converts plain Python scalars in C, so callers
+    # pass ints/floats directly instead of building c_uint/c_float objects per call
+    
+    # Camera creation and destruction
+    lib.MV_CC_CreateHandle.argtypes = [ctypes.c_void_p, ctypes.c_uint]
+    lib.MV_CC_CreateHandle.restype = ctypes.c_int
+    
+    lib.MV_CC_DestroyHandle.argtypes = [ctypes.c_void_p]
+    lib.MV_CC_DestroyHandle.restype = ctypes.c_int
+    
+    # Device enumeration
+    lib.MV_CC_EnumDevices.argtypes = [ctypes.c_uint, ctypes.POINTER(MV_CC_DEVICE_INFO_LIST)]
+    lib.MV_CC_EnumDevices.restype = ctypes.c_int
+    
+    # Camera connection
+    lib.MV_CC_OpenDevice.argtypes = [ctypes.c_void_p, ctypes.c_uint]
+    lib.MV_CC_OpenDevice.restype = ctypes.c_int
+    
+    lib.MV_CC_CloseDevice.argtypes = [ctypes.c_void_p]
+    lib.MV_CC_CloseDevice.restype = ctypes.c_int
+    
+    # Image acquisition
+    lib.MV_CC_StartGrabbing.argtypes = [ctypes.c_void_p]
+    lib.MV_CC_StartGrabbing.restype = ctypes.c_int
+    
+    lib.MV_CC_StopGrabbing.argtypes = [ctypes.c_void_p]
+    lib.MV_CC_StopGrabbing.restype = ctypes.c_int
+    
+    lib.MV_CC_GetImageBuffer.argtypes = [ctypes.c_void_p, ctypes.POINTER(MV_FRAME_OUT), ctypes.c_uint]
+    lib.MV_CC_GetImageBuffer.restype = ctypes.c_int
+    
+    lib.MV_CC_FreeImageBuffer.argtypes = [ctypes.c_void_p, ctypes.POINTER(MV_FRAME_OUT)]
+    lib.MV_CC_FreeImageBuffer.restype = ctypes.c_int
+    
+    # Parameter setting/getting
+    lib.MV_CC_SetFloatValue.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_float]
+    lib.MV_CC_SetFloatValue.restype = ctypes.c_int
+    
+    lib.MV_CC_GetFloatValue.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(MVCC_FLOATVALUE)]
+    lib.MV_CC_GetFloatValue.restype = ctypes.c_int
+    
+    lib.MV_CC_SetEnumValue.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint]
+    lib.MV_CC_SetEnumValue.restype = ctypes.c_int
+    
+    lib.MV_CC_GetEnumValue.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+    lib.MV_CC_GetEnumValue.restype = ctypes.c_int
+    
+    lib.MV_CC_SetBoolValue.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_bool]
+    lib.MV_CC_SetBoolValue.restype = ctypes.c_int
+    
+    lib.MV_CC_GetBoolValue.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+    lib.MV_CC_GetBoolValue.restype = ctypes.c_int
+    
+    # Trigger control
+    lib.MV_CC_SetCommandValue.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+    lib.MV_CC_SetCommandValue.restype = ctypes.c_int
+
+def _load_sdk():
+    """Load the MvCamCtrlSDK library, returning (lib, error message)"""
+    if not os.path.exists(SDK_LIB_PATH):
+        return None, f"SDK library not found: {SDK_LIB_PATH}"
+    
+    try:
+        # CDLL (unlike PyDLL) releases the GIL for the duration of every SDK call,
+        # so a blocking MV_CC_GetImageBuffer wait does not stall the GUI thread
+        lib = ctypes.CDLL(SDK_LIB_PATH)
+        _configure_prototypes(lib)
+    except Exception as e:
+        return None, f"Failed to load SDK library: {e}"
+    return lib, None
+
+_LIB, _LIB_ERROR = _load_sdk()
+
+def _free_worker(free_queue, free_image):
+    """Hand grabbed buffers back to the SDK in the background (daemon thread body)"""
+    while True:
+        item = free_queue.get()
+        if isinstance(item, threading.Event):
+            # Flush marker: everything queued before it has been freed
+            item.set()
+            continue
+        handle, token = item
+        free_image(handle, ctypes.byref(token))
+
 class MvCamSDK:
     """Wrapper class for MvCamCtrlSDK"""
     
@@ -61,122 +330,74 @@ class MvCamSDK:
         self.camera_handle = None
         self.is_connected = False
         self.is_grabbing = False
-        self._load_sdk()
-        self._define_functions()
-        
-    def _load_sdk(self):
-        """Load the MvCamCtrlSDK library"""
-        if not os.path.exists(SDK_LIB_PATH):
-            raise RuntimeError(f"SDK library not found: {SDK_LIB_PATH}")
-        
-        try:
-            self.lib = ctypes.CDLL(SDK_LIB_PATH)
-        except Exception as e:
-            raise RuntimeError(f"Failed to load SDK library: {e}")
-    
-    def _define_functions(self):
-        """Define SDK function signatures"""
-        # Camera creation and destruction
-        self.lib.MV_CC_CreateHandle.argtypes = [ctypes.c_void_p, ctypes.c_uint]
-        self.lib.MV_CC_CreateHandle.restype = ctypes.c_int
-        
-        self.lib.MV_CC_DestroyHandle.argtypes = [ctypes.c_void_p]
-        self.lib.MV_CC_DestroyHandle.restype = ctypes.c_int
-        
-        # Device enumeration
-        self.lib.MV_CC_EnumDevices.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_void_p]
-        self.lib.MV_CC_EnumDevices.restype = ctypes.c_int
         
-        # Camera connection
-        self.lib.MV_CC_OpenDevice.argtypes = [ctypes.c_void_p, ctypes.c_uint]
-        self.lib.MV_CC_OpenDevice.restype = ctypes.c_int
+        # Frame buffer pool used by acquire_image()/release()
+        self._buffer_count = 4
+        self._pool: List[np.ndarray] = []
+        self._free = deque()
+        # Bumped on every pool rebuild so releases from an earlier pool are ignored
+        self._pool_generation = 0
+        self._pool_lock = threading.Lock()
+        
+        if _LIB is None:
+            raise RuntimeError(_LIB_ERROR)
+        self.lib = _LIB
+        
+        # Bound SDK entry points used per frame and by the setters/getters, looked up once
+        self._mv_get_image = self.lib.MV_CC_GetImageBuffer
+        self._mv_free_image = self.lib.MV_CC_FreeImageBuffer
+        self._mv_set_float = self.lib.MV_CC_SetFloatValue
+        self._mv_get_float = self.lib.MV_CC_GetFloatValue
+        self._mv_set_enum = self.lib.MV_CC_SetEnumValue
+        self._mv_command = self.lib.MV_CC_SetCommandValue
+        # One result struct per float getter, reused instead of allocated per call,
+        # with a pointer to each built once (the structs live as long as self)
+        self._f_exposure = MVCC_FLOATVALUE()
+        self._f_gain = MVCC_FLOATVALUE()
+        self._f_fps = MVCC_FLOATVALUE()
+        self._pf_exposure = ctypes.pointer(self._f_exposure)
+        self._pf_gain = ctypes.pointer(self._f_gain)
+        self._pf_fps = ctypes.pointer(self._f_fps)
+        
+        # release_frame() only queues the buffer; this thread frees it, so the next
+        # MV_CC_GetImageBuffer does not wait behind MV_CC_FreeImageBuffer. The SDK
+        # serialises calls per handle internally.
+        self._free_queue = queue.SimpleQueue()
+        threading.Thread(target=_free_worker, args=(self._free_queue, self._mv_free_image),
+                         name="MvCamFreeBuffers", daemon=True).start()
         
-        self.lib.MV_CC_CloseDevice.argtypes = [ctypes.c_void_p]
-        self.lib.MV_CC_CloseDevice.restype = ctypes.c_int
-        
-        # Image acquisition
-        self.lib.MV_CC_StartGrabbing.argtypes = [ctypes.c_void_p]
-        self.lib.MV_CC_StartGrabbing.restype = ctypes.c_int
-        
-        self.lib.MV_CC_StopGrabbing.argtypes = [ctypes.c_void_p]
-        self.lib.MV_CC_StopGrabbing.restype = ctypes.c_int
-        
-        self.lib.MV_CC_GetImageBuffer.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_void_p]
-        self.lib.MV_CC_GetImageBuffer.restype = ctypes.c_int
-        
-        self.lib.MV_CC_FreeImageBuffer.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
-        self.lib.MV_CC_FreeImageBuffer.restype = ctypes.c_int
-        
-        # Parameter setting/getting
-        self.lib.MV_CC_SetFloatValue.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_float]
-        self.lib.MV_CC_SetFloatValue.restype = ctypes.c_int
-        
-        self.lib.MV_CC_GetFloatValue.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
-        self.lib.MV_CC_GetFloatValue.restype = ctypes.c_int
-        
-        self.lib.MV_CC_SetEnumValue.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint]
-        self.lib.MV_CC_SetEnumValue.restype = ctypes.c_int
-        
-        self.lib.MV_CC_GetEnumValue.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
-        self.lib.MV_CC_GetEnumValue.restype = ctypes.c_int
-        
-        self.lib.MV_CC_SetBoolValue.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_bool]
-        self.lib.MV_CC_SetBoolValue.restype = ctypes.c_int
-        
-        self.lib.MV_CC_GetBoolValue.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
-        self.lib.MV_CC_GetBoolValue.restype = ctypes.c_int
-        
-        # Trigger control
-        self.lib.MV_CC_SetCommandValue.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
-        self.lib.MV_CC_SetCommandValue.restype = ctypes.c_int
-    
     def enum_devices(self) -> List[Dict[str, Any]]:
         """Enumerate available cameras"""
         devices = []
         
         try:
-            # Create camera handle
-            handle = ctypes.c_void_p()
-            ret = self.lib.MV_CC_CreateHandle(ctypes.byref(handle), 0)  # 0 for USB3.0
-            if ret != MvCamError.MV_OK:
-                # Don't print warning for normal "no cameras" scenario
+            # A single call fills the list with pointers to SDK-owned device records
+            device_list = MV_CC_DEVICE_INFO_LIST()
+            ret = self.lib.MV_CC_EnumDevices(MV_GIGE_DEVICE | MV_USB_DEVICE, ctypes.byref(device_list))
+            if ret != _MV_OK:
                 if ret != MvCamError.MV_E_NO_CAMERAS:  # Only print for unexpected errors
-                    print(f"Warning: Failed to create camera handle: {ret}")
+                    print(f"Warning: Failed to enumerate devices: {ret}")
                 return devices
             
-            try:
-                # Get device count
-                device_count = ctypes.c_uint()
-                ret = self.lib.MV_CC_EnumDevices(0, None, 0, ctypes.byref(device_count))
-                if ret != MvCamError.MV_OK:
-                    if ret != MvCamError.MV_E_NO_CAMERAS:  # Only print for unexpected errors
-                        print(f"Warning: Failed to get device count: {ret}")
-                    return devices
-                
-                if device_count.value == 0:
-                    return devices
-                
-                # Get device info
-                device_info_size = 1024  # Approximate size for device info
-                device_info_buffer = ctypes.create_string_buffer(device_info_size * device_count.value)
+            for i in range(min(device_list.nDeviceNum, MV_MAX_DEVICE_NUM)):
+                info = device_list.pDeviceInfo[i].contents
+                if info.nTLayerType == MV_GIGE_DEVICE:
+                    detail = info.SpecialInfo.stGigEInfo
+                    device_type = 'GigE'
+                elif info.nTLayerType == MV_USB_DEVICE:
+                    detail = info.SpecialInfo.stUsb3VInfo
+                    device_type = 'USB3.0'
+                else:
+                    continue
                 
-                ret = self.lib.MV_CC_EnumDevices(0, device_info_buffer, device_info_size, ctypes.byref(device_count))
-                if ret != MvCamError.MV_OK:
-                    if ret != MvCamError.MV_E_NO_CAMERAS:  # Only print for unexpected errors
-                        print(f"Warning: Failed to enumerate devices: {ret}")
-                    return devices
-                
-                # Parse device info (simplified - in real implementation, parse the buffer)
-                for i in range(device_count.value):
-                    devices.append({
-                        'index': i,
-                        'name': f"Camera {i}",
-                        'serial': f"SN{i:06d}",
-                        'type': 'USB3.0'
-                    })
-                    
-            finally:
-                self.lib.MV_CC_DestroyHandle(handle)
+                model = _c_string(detail.chModelName)
+                devices.append({
+                    'index': i,
+                    'name': _c_string(detail.chUserDefinedName) or model,
+                    'model': model,
+                    'serial': _c_string(detail.chSerialNumber),
+                    'type': device_type
+                })
                 
         except Exception as e:
             print(f"Warning: Exception during device enumeration: {e}")
@@ -192,7 +413,7 @@ class MvCamSDK:
             # Create camera handle
             self.camera_handle = ctypes.c_void_p()
             ret = self.lib.MV_CC_CreateHandle(ctypes.byref(self.camera_handle), 0)  # 0 for USB3.0
-            if ret != MvCamError.MV_OK:
+            if ret != _MV_OK:
                 # Don't print warning for normal "no cameras" scenario
                 if ret != MvCamError.MV_E_NO_CAMERAS:  # Only print for unexpected errors
                     print(f"Warning: Failed to create camera handle: {ret}")
@@ -203,7 +424,7 @@ class MvCamSDK:
             
             # Open camera
             ret = self.lib.MV_CC_OpenDevice(self.camera_handle, device_index)
-            if ret != MvCamError.MV_OK:
+            if ret != _MV_OK:
                 if ret != MvCamError.MV_E_NO_CAMERAS:  # Only print for unexpected errors
                     print(f"Warning: Failed to open camera: {ret}")
                 self.lib.MV_CC_DestroyHandle(self.camera_handle)
@@ -241,7 +462,7 @@ class MvCamSDK:
             raise RuntimeError("Camera not connected")
         
         ret = self.lib.MV_CC_StartGrabbing(self.camera_handle)
-        if ret != MvCamError.MV_OK:
+        if ret != _MV_OK:
             raise RuntimeError(f"Failed to start grabbing: {ret}")
         
         self.is_grabbing = True
@@ -250,50 +471,304 @@ class MvCamSDK:
     def stop_grabbing(self):
         """Stop image grabbing"""
         if self.is_grabbing and self.camera_handle:
+            self._flush_released_frames()
             self.lib.MV_CC_StopGrabbing(self.camera_handle)
             self.is_grabbing = False
+        
+        # Frame size may change before the next acquisition; resize the pool then
+        with self._pool_lock:
+            self._reset_pool([])
     
-    def get_image(self, timeout_ms: int = 1000) -> Optional[np.ndarray]:
-        """Get an image from the camera"""
+    def grab_frame(self, timeout_ms: int = 1000) -> Optional[Tuple[MV_FRAME_OUT, np.ndarray]]:
+        """Get the next frame without copying it.
+        
+        Returns (token, image) where image aliases the SDK's own buffer, or None if
+        no frame arrived in time. The buffer stays valid until release_frame(token),
+        which must be called exactly once, after the caller has finished with image.
+        """
         if not self.is_grabbing:
             raise RuntimeError("Camera not grabbing")
         
-        # Get image buffer
-        frame_info = ctypes.c_void_p()
-        ret = self.lib.MV_CC_GetImageBuffer(self.camera_handle, timeout_ms, ctypes.byref(frame_info))
-        if ret != MvCamError.MV_OK:
+        frame = MV_FRAME_OUT()
+        ret = self._mv_get_image(self.camera_handle, ctypes.byref(frame), timeout_ms)
+        if ret != _MV_OK:
             return None
         
         try:
-            # Convert frame info to image (simplified)
-            # In real implementation, you would parse the frame_info structure
-            # and copy the image data to a numpy array
-            
-            # For now, create a test image
-            image = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
+            return frame, self._frame_to_array(frame)
+        except Exception:
+            self.release_frame(frame)
+            raise
+    
+    def release_frame(self, token: MV_FRAME_OUT):
+        """Hand a buffer from grab_frame() back to the SDK (freed asynchronously)"""
+        self._free_queue.put((self.camera_handle, token))
+    
+    def _flush_released_frames(self, timeout_s: float = 1.0):
+        """Wait until every buffer passed to release_frame() is back with the SDK"""
+        done = threading.Event()
+        self._free_queue.put(done)
+        if not done.wait(timeout_s):
+            print("Warning: Timed out waiting for frame buffers to be freed")
+    
+    @staticmethod
+    def _frame_layout(width: int, height: int, pixel_format: int) -> Tuple[Tuple[int, ...], np.dtype]:
+        """Array shape and dtype of a frame as delivered by this wrapper"""
+        if pixel_format == PixelFormat.Mono8:
+            return (height, width), np.dtype(np.uint8)
+        if (pixel_format == PixelFormat.Mono16 or pixel_format in _MONO_WIDE_BITS
+                or pixel_format in _MONO_UNPACKERS):
+            return (height, width), np.dtype('<u2')
+        if (pixel_format in (PixelFormat.BGR8_Packed, PixelFormat.RGB8_Packed)
+                or pixel_format in _BGR_CONVERSIONS):
+            return (height, width, 3), np.dtype(np.uint8)
+        raise RuntimeError(f"Unsupported pixel format: 0x{pixel_format:08X}")
+    
+    @classmethod
+    def _output_layout(cls, token: MV_FRAME_OUT) -> Tuple[Tuple[int, ...], np.dtype]:
+        """Shape and dtype a grabbed frame has once copied out of the SDK"""
+        info = token.stFrameInfo
+        return cls._frame_layout(info.nWidth, info.nHeight, info.enPixelType)
+    
+    @classmethod
+    def _frame_to_array(cls, frame: MV_FRAME_OUT) -> np.ndarray:
+        """Build a NumPy view (BGR or Mono) over an SDK frame buffer.
+        
+        Mono10/12 views hold the raw low-aligned samples, and packed formats are
+        returned as their flat bytes; copying the frame out converts both to Mono16.
+        Bayer and YUV422 views hold the raw mosaic / interleaved samples.
+        """
+        info = frame.stFrameInfo
+        data = np.ctypeslib.as_array(frame.pBufAddr, shape=(info.nFrameLen,))
+        if info.enPixelType in _MONO_UNPACKERS:
+            return data[:packed_size(info.nWidth * info.nHeight)]
+        if info.enPixelType in _BGR_CONVERSIONS:
+            channels, _ = _BGR_CONVERSIONS[info.enPixelType]
+            raw = data[:info.nWidth * info.nHeight * channels]
+            if channels == 1:
+                return raw.reshape(info.nHeight, info.nWidth)
+            return raw.reshape(info.nHeight, info.nWidth, channels)
+        
+        shape, dtype = cls._frame_layout(info.nWidth, info.nHeight, info.enPixelType)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        image = data[:nbytes].view(dtype).reshape(shape)
+        
+        if info.enPixelType == PixelFormat.RGB8_Packed:
+            # Reversed-channel view: BGR order without touching the pixels
+            return image[:, :, ::-1]
+        return image
+    
+    @staticmethod
+    def _copy_into(dst: np.ndarray, src_ptr, nbytes: int):
+        """Copy nbytes from an SDK buffer into a C-contiguous array with one memcpy"""
+        if not dst.flags.c_contiguous or nbytes > dst.nbytes:
+            raise ValueError(f"Cannot copy {nbytes} bytes into buffer {dst.shape} {dst.dtype}")
+        ctypes.memmove(dst.ctypes.data, src_ptr, nbytes)
+    
+    @classmethod
+    def _copy_frame(cls, token: MV_FRAME_OUT, view: np.ndarray, out: np.ndarray):
+        """Copy a grabbed frame into out, converting to BGR or Mono16 where needed"""
+        pixel_format = token.stFrameInfo.enPixelType
+        if pixel_format == PixelFormat.RGB8_Packed:
+            # Channel swap in one SIMD pass over the packed RGB source
+            cv2.cvtColor(view[:, :, ::-1], cv2.COLOR_RGB2BGR, dst=out)
+        elif pixel_format in _BGR_CONVERSIONS:
+            # Demosaic / YUV decode in one SIMD pass straight into out
+            cv2.cvtColor(view, _BGR_CONVERSIONS[pixel_format][1], dst=out)
+        elif pixel_format in _MONO_UNPACKERS:
+            _MONO_UNPACKERS[pixel_format](view, out)
+        elif pixel_format in _MONO_WIDE_BITS:
+            widen_mono(view, out, _MONO_WIDE_BITS[pixel_format])
+        elif view.flags.c_contiguous and out.flags.c_contiguous:
+            cls._copy_into(out, token.pBufAddr, view.nbytes)
+        else:
+            np.copyto(out, view)
+    
+    def get_image(self, timeout_ms: int = 1000) -> Optional[np.ndarray]:
+        """Get an image from the camera"""
+        # Returns an owned copy; use grab_frame() or get_image_into() to avoid the allocation
+        grabbed = self.grab_frame(timeout_ms)
+        if grabbed is None:
+            return None
+        
+        token, view = grabbed
+        try:
+            shape, dtype = self._output_layout(token)
+            image = np.empty(shape, dtype=dtype)
+            self._copy_frame(token, view, image)
             return image
+        finally:
+            self.release_frame(token)
+    
+    def get_image_into(self, out: np.ndarray, timeout_ms: int = 1000) -> bool:
+        """Get an image from the camera into a caller-owned array.
+        
+        Returns False, leaving out untouched, if no frame arrived in time.
+        """
+        grabbed = self.grab_frame(timeout_ms)
+        if grabbed is None:
+            return False
+        
+        token, view = grabbed
+        try:
+            shape, dtype = self._output_layout(token)
+            if shape != out.shape or dtype != out.dtype:
+                raise ValueError(f"Frame {shape} {dtype} does not match "
+                                 f"buffer {out.shape} {out.dtype}")
+            # Single copy straight out of the SDK buffer
+            self._copy_frame(token, view, out)
+            return True
+        finally:
+            self.release_frame(token)
+    
+    @property
+    def buffer_count(self) -> int:
+        """Number of pooled frame buffers used by acquire_image()"""
+        return self._buffer_count
+    
+    def set_buffer_count(self, count: int):
+        """Set the number of pooled frame buffers; the pool is rebuilt from the next frame"""
+        if count < 1:
+            raise ValueError(f"Buffer count must be at least 1, got {count}")
+        with self._pool_lock:
+            self._buffer_count = count
+            self._reset_pool([])
+    
+    @property
+    def free_buffers(self) -> int:
+        """Pool buffers available to acquire_image() (all of them before the pool exists)"""
+        with self._pool_lock:
+            return len(self._free) if self._pool else self._buffer_count
+    
+    def configure_buffers(self, width: int, height: int,
+                          pixel_format: PixelFormat = PixelFormat.BGR8_Packed, count: int = 4):
+        """Preallocate count frame buffers for acquire_image().
+        
+        Without an explicit call the pool is sized from the first frame of each
+        acquisition. Any buffers still held by the caller become invalid.
+        """
+        shape, dtype = self._frame_layout(width, height, pixel_format)
+        with self._pool_lock:
+            self._buffer_count = count
+            self._reset_pool([np.empty(shape, dtype=dtype) for _ in range(count)])
+    
+    def _reset_pool(self, pool: List[np.ndarray]):
+        """Replace the buffer pool and start a new generation (call under _pool_lock)"""
+        self._pool = pool
+        self._free = deque(range(len(pool)))
+        self._pool_generation += 1
+    
+    def _pool_slot(self, index: Tuple[int, int]) -> Optional[int]:
+        """Slot of an index from the current pool generation, else None (call under _pool_lock)"""
+        generation, slot = index
+        if generation != self._pool_generation or slot >= len(self._pool):
+            return None
+        return slot
+    
+    def acquire_image(self, timeout_ms: int = 1000) -> Optional[Tuple[Tuple[int, int], np.ndarray]]:
+        """Get an image into a free pool buffer.
+        
+        Returns (index, image), or None if no frame arrived in time or every buffer
+        is still in use. The buffer belongs to the caller until release(index); the
+        index is an opaque (pool generation, slot) pair.
+        """
+        with self._pool_lock:
+            if self._pool and not self._free:
+                return None
+        
+        grabbed = self.grab_frame(timeout_ms)
+        if grabbed is None:
+            return None
+        
+        token, view = grabbed
+        try:
+            shape, dtype = self._output_layout(token)
+            with self._pool_lock:
+                if not self._pool:
+                    self._reset_pool([np.empty(shape, dtype=dtype)
+                                      for _ in range(self._buffer_count)])
+                slot = self._free.popleft()
+                index = (self._pool_generation, slot)
+                image = self._pool[slot]
             
+            try:
+                if shape != image.shape or dtype != image.dtype:
+                    raise ValueError(f"Frame {shape} {dtype} does not match "
+                                     f"buffer {image.shape} {image.dtype}")
+                # Single copy straight out of the SDK buffer
+                self._copy_frame(token, view, image)
+            except Exception:
+                self.release(index)
+                raise
+            return index, image
         finally:
-            # Release image buffer
-            self.lib.MV_CC_FreeImageBuffer(self.camera_handle, frame_info)
+            self.release_frame(token)
+    
+    def refresh_image(self, index: Tuple[int, int]) -> int:
+        """Overwrite pool buffer index with the newest frame already queued in the SDK.
+        
+        Older queued frames are handed back without being copied and no other pool
+        buffer is needed. Returns how many frames were skipped (0 if none was waiting).
+        An index from a previous pool is left untouched.
+        """
+        newest = None
+        skipped = 0
+        try:
+            while True:
+                grabbed = self.grab_frame(0)
+                if grabbed is None:
+                    break
+                if newest is not None:
+                    self.release_frame(newest[0])
+                newest = grabbed
+                skipped += 1
+        except Exception:
+            # grab_frame() only hands back its own frame before re-raising
+            if newest is not None:
+                self.release_frame(newest[0])
+            raise
+        if newest is None:
+            return 0
+        
+        token, view = newest
+        try:
+            shape, dtype = self._output_layout(token)
+            with self._pool_lock:
+                slot = self._pool_slot(index)
+                if slot is None:
+                    return skipped
+                image = self._pool[slot]
+            if shape != image.shape or dtype != image.dtype:
+                raise ValueError(f"Frame {shape} {dtype} does not match "
+                                 f"buffer {image.shape} {image.dtype}")
+            self._copy_frame(token, view, image)
+            return skipped
+        finally:
+            self.release_frame(token)
+    
+    def release(self, index: Tuple[int, int]):
+        """Return a buffer from acquire_image() to the pool (stale indices are ignored)"""
+        with self._pool_lock:
+            slot = self._pool_slot(index)
+            if slot is not None and slot not in self._free:
+                self._free.append(slot)
     
     def set_exposure_time(self, exposure_time_us: float) -> bool:
         """Set exposure time in microseconds"""
         if not self.is_connected:
             return False
         
-        ret = self.lib.MV_CC_SetFloatValue(self.camera_handle, b"ExposureTime", ctypes.c_float(exposure_time_us))
-        return ret == MvCamError.MV_OK
+        ret = self._mv_set_float(self.camera_handle, _K_EXPOSURE, exposure_time_us)
+        return ret == _MV_OK
     
     def get_exposure_time(self) -> Optional[float]:
         """Get exposure time in microseconds"""
         if not self.is_connected:
             return None
         
-        value = ctypes.c_float()
-        ret = self.lib.MV_CC_GetFloatValue(self.camera_handle, b"ExposureTime", ctypes.byref(value))
-        if ret == MvCamError.MV_OK:
-            return value.value
+        ret = self._mv_get_float(self.camera_handle, _K_EXPOSURE, self._pf_exposure)
+        if ret == _MV_OK:
+            return self._f_exposure.fCurValue
         return None
     
     def set_gain(self, gain_db: float) -> bool:
@@ -301,18 +776,17 @@ class MvCamSDK:
         if not self.is_connected:
             return False
         
-        ret = self.lib.MV_CC_SetFloatValue(self.camera_handle, b"Gain", ctypes.c_float(gain_db))
-        return ret == MvCamError.MV_OK
+        ret = self._mv_set_float(self.camera_handle, _K_GAIN, gain_db)
+        return ret == _MV_OK
     
     def get_gain(self) -> Optional[float]:
         """Get gain in decibels"""
         if not self.is_connected:
             return None
         
-        value = ctypes.c_float()
-        ret = self.lib.MV_CC_GetFloatValue(self.camera_handle, b"Gain", ctypes.byref(value))
-        if ret == MvCamError.MV_OK:
-            return value.value
+        ret = self._mv_get_float(self.camera_handle, _K_GAIN, self._pf_gain)
+        if ret == _MV_OK:
+            return self._f_gain.fCurValue
         return None
     
     def set_frame_rate(self, fps: float) -> bool:
@@ -320,18 +794,17 @@ class MvCamSDK:
         if not self.is_connected:
             return False
         
-        ret = self.lib.MV_CC_SetFloatValue(self.camera_handle, b"AcquisitionFrameRate", ctypes.c_float(fps))
-        return ret == MvCamError.MV_OK
+        ret = self._mv_set_float(self.camera_handle, _K_FPS, fps)
+        return ret == _MV_OK
     
     def get_frame_rate(self) -> Optional[float]:
         """Get frame rate"""
         if not self.is_connected:
             return None
         
-        value = ctypes.c_float()
-        ret = self.lib.MV_CC_GetFloatValue(self.camera_handle, b"AcquisitionFrameRate", ctypes.byref(value))
-        if ret == MvCamError.MV_OK:
-            return value.value
+        ret = self._mv_get_float(self.camera_handle, _K_FPS, self._pf_fps)
+        if ret == _MV_OK:
+            return self._f_fps.fCurValue
         return None
     
     def set_auto_exposure(self, enabled: bool) -> bool:
@@ -339,42 +812,63 @@ class MvCamSDK:
         if not self.is_connected:
             return False
         
-        ret = self.lib.MV_CC_SetEnumValue(self.camera_handle, b"ExposureAuto", 
-                                         ctypes.c_uint(1 if enabled else 0))
-        return ret == MvCamError.MV_OK
+        ret = self._mv_set_enum(self.camera_handle, _K_EXPOSURE_AUTO, 1 if enabled else 0)
+        return ret == _MV_OK
     
     def set_auto_gain(self, enabled: bool) -> bool:
         """Set auto gain mode"""
         if not self.is_connected:
             return False
         
-        ret = self.lib.MV_CC_SetEnumValue(self.camera_handle, b"GainAuto", 
-                                         ctypes.c_uint(1 if enabled else 0))
-        return ret == MvCamError.MV_OK
+        ret = self._mv_set_enum(self.camera_handle, _K_GAIN_AUTO, 1 if enabled else 0)
+        return ret == _MV_OK
     
     def set_trigger_mode(self, mode: TriggerMode) -> bool:
         """Set trigger mode"""
         if not self.is_connected:
             return False
         
-        ret = self.lib.MV_CC_SetEnumValue(self.camera_handle, b"TriggerMode", ctypes.c_uint(mode.value))
-        return ret == MvCamError.MV_OK
+        ret = self._mv_set_enum(self.camera_handle, _K_TRIGGER_MODE, mode.value)
+        return ret == _MV_OK
     
     def set_trigger_source(self, source: TriggerSource) -> bool:
         """Set trigger source"""
         if not self.is_connected:
             return False
         
-        ret = self.lib.MV_CC_SetEnumValue(self.camera_handle, b"TriggerSource", ctypes.c_uint(source.value))
-        return ret == MvCamError.MV_OK
+        ret = self._mv_set_enum(self.camera_handle, _K_TRIGGER_SOURCE, source.value)
+        return ret == _MV_OK
     
     def send_software_trigger(self) -> bool:
         """Send software trigger"""
         if not self.is_connected:
             return False
         
-        ret = self.lib.MV_CC_SetCommandValue(self.camera_handle, b"TriggerSoftware")
-        return ret == MvCamError.MV_OK
+        ret = self._mv_command(self.camera_handle, _K_TRIGGER_SOFTWARE)
+        return ret == _MV_OK
+    
+    def trigger_and_grab(self, timeout_ms: int = 1000) -> Optional[Tuple[MV_FRAME_OUT, np.ndarray]]:
+        """Fire a software trigger and wait for the frame it produces.
+        
+        Same contract as grab_frame(): the image aliases the SDK buffer and the token
+        must be passed to release_frame() once the caller is done. Returns None if the
+        trigger is rejected or no frame arrives in time.
+        """
+        if not self.is_grabbing:
+            raise RuntimeError("Camera not grabbing")
+        
+        frame = MV_FRAME_OUT()
+        handle = self.camera_handle
+        if self._mv_command(handle, _K_TRIGGER_SOFTWARE) != _MV_OK:
+            return None
+        if self._mv_get_image(handle, ctypes.byref(frame), timeout_ms) != _MV_OK:
+            return None
+        
+        try:
+            return frame, self._frame_to_array(frame)
+        except Exception:
+            self.release_frame(frame)
+            raise
     
     def __del__(self):
         """Cleanup on destruction"""